@@ -0,0 +1,43 @@
+"""Persistent cache of repository status for the list and tree views."""
+
+import contextlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def cache_file() -> Path:
+    """Get the location of the status cache, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "reposort" / "index.json"
+
+
+def load_cache(path: Path) -> dict[str, Any]:
+    """Load cached entries keyed by repository path; empty if missing or corrupt."""
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(path: Path, entries: dict[str, Any]) -> None:
+    """
+    Write cached entries atomically.
+
+    The entries are written to a temporary file next to the cache and moved
+    into place with os.replace, so readers never see a partial file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".index-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
@@ -1,8 +1,9 @@
 """Click CLI for reposort."""
 
-import shutil
+import contextlib
 import subprocess
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import click
@@ -10,18 +11,33 @@ from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
 
+from reposort.cache import cache_file, load_cache, save_cache
 from reposort.core import (
+    CLONE_JOBS,
     RepoInfo,
-    clone_repository,
+    clone_many,
     collect_repo_info,
-    find_git_repos,
-    get_git_origin_url,
+    get_all_origin_urls,
+    get_target_path,
     get_unique_target_path,
-    parse_git_url,
+    iter_git_repos,
+    move_repository,
 )
 
 CONTEXT_SETTINGS = {"max_content_width": 200}
 
+# Number of repository moves run concurrently
+MOVE_WORKERS = 8
+
+# Status markup shared by every row of the list and tree views
+CLEAN_STATUS = "[green]clean[/green]"
+DIRTY_STATUS = "[red]dirty[/red]"
+
+
+def make_console() -> Console:
+    """Console for the list and tree views, without per-cell auto-highlighting."""
+    return Console(highlight=False, emoji=False)
+
 
 @click.group(invoke_without_command=True, context_settings=CONTEXT_SETTINGS)
 @click.pass_context
@@ -69,51 +85,53 @@ def sort(source: Path, target: Path, dry_run: bool) -> None:
     source = source.resolve()
     target = target.expanduser().resolve()
 
-    repos = find_git_repos(source)
-
-    if not repos:
-        click.echo(f"No git repositories found in {source}")
-        return
-
-    click.echo(f"Found {len(repos)} git repositories")
-    click.echo()
+    repos = iter_git_repos(source)
 
     moves: list[tuple[Path, Path, str]] = []
+    # Targets already handed out, so repositories sharing an origin don't collide
+    claimed: set[Path] = set()
     skipped: list[tuple[Path, str]] = []
+    found = 0
 
-    for repo in repos:
-        origin_url = get_git_origin_url(repo)
+    # Origin URLs are looked up while the walk is still running, and the plan is
+    # printed as it is computed rather than after the whole tree is scanned
+    for repo, origin_url in get_all_origin_urls(repos):
+        found += 1
+
+        # A .git file points into another repository's git directory, which
+        # refers back to this path; moving it would break the link
+        if (repo / ".git").is_file():
+            skipped.append((repo, "Linked worktree or submodule"))
+            continue
 
         if not origin_url:
             skipped.append((repo, "No origin URL found"))
             continue
 
-        parsed = parse_git_url(origin_url)
-        if not parsed:
+        # Use the full path to preserve organizational structure
+        target_path = get_target_path(target, origin_url)
+        if target_path is None:
             skipped.append((repo, f"Could not parse URL: {origin_url}"))
             continue
 
-        host, path = parsed
-        # Use the full path to preserve organizational structure
-        target_path = target / host / path
-
         # Check for conflicts and get unique path if needed
-        final_target = get_unique_target_path(target_path)
+        final_target, conflict = get_unique_target_path(target_path, claimed)
+        claimed.add(final_target)
 
+        if not moves:
+            click.echo("Planned moves:")
+            click.echo("-" * 80)
         moves.append((repo, final_target, origin_url))
 
-    # Print plan
-    if moves:
-        click.echo("Planned moves:")
-        click.echo("-" * 80)
-        for source_repo, target_repo, url in moves:
-            suffix = ""
-            if "-copy" in str(target_repo):
-                suffix = " [CONFLICT - renamed]"
-            click.echo(f"  {source_repo.name}")
-            click.echo(f"    Origin: {url}")
-            click.echo(f"    -> {target_repo}{suffix}")
-            click.echo()
+        suffix = " [CONFLICT - renamed]" if conflict else ""
+        click.echo(f"  {repo.name}")
+        click.echo(f"    Origin: {origin_url}")
+        click.echo(f"    -> {final_target}{suffix}")
+        click.echo()
+
+    if not found:
+        click.echo(f"No git repositories found in {source}")
+        return
 
     if skipped:
         click.echo("\nSkipped repositories:")
@@ -122,6 +140,8 @@ def sort(source: Path, target: Path, dry_run: bool) -> None:
             click.echo(f"  {repo.name}: {reason}")
         click.echo()
 
+    click.echo(f"Found {found} git repositories")
+
     # Execute moves if not dry-run
     if dry_run:
         click.echo("\n[DRY RUN] No changes made. Run without --dry-run to execute.")
@@ -134,22 +154,35 @@ def sort(source: Path, target: Path, dry_run: bool) -> None:
         click.echo("\nExecuting moves...")
         click.echo("-" * 80)
 
-        for source_repo, target_repo, _url in moves:
-            try:
-                # Create parent directories
-                target_repo.parent.mkdir(parents=True, exist_ok=True)
-
-                # Move the repository
-                shutil.move(str(source_repo), str(target_repo))
-                click.echo(f"✓ Moved {source_repo.name} -> {target_repo}")
-            except Exception as e:
-                click.echo(f"✗ Failed to move {source_repo.name}: {e}")
+        # Create each parent directory once, up front, so the workers don't race
+        # on mkdir. Shallowest first, so every mkdir finds its ancestors already
+        # in place. A failure here surfaces as a failed move below.
+        parents = {target_repo.parent for _source, target_repo, _url in moves}
+        for parent in sorted(parents, key=lambda p: len(p.parts)):
+            with contextlib.suppress(OSError):
+                parent.mkdir(parents=True, exist_ok=True)
+
+        # Move repositories concurrently; cross-filesystem moves copy data and
+        # benefit from overlapping I/O
+        with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as pool:
+            futures = {}
+            for source_repo, target_repo, _url in moves:
+                future = pool.submit(move_repository, source_repo, target_repo)
+                futures[future] = (source_repo, target_repo)
+
+            for future in as_completed(futures):
+                source_repo, target_repo = futures[future]
+                try:
+                    future.result()
+                    click.echo(f"✓ Moved {source_repo.name} -> {target_repo}")
+                except Exception as e:
+                    click.echo(f"✗ Failed to move {source_repo.name}: {e}")
 
         click.echo("\nDone!")
 
 
 @cli.command()
-@click.argument("url")
+@click.argument("urls", metavar="URL...", nargs=-1, required=True)
 @click.option(
     "--target",
     type=click.Path(path_type=Path),
@@ -166,9 +199,47 @@ def sort(source: Path, target: Path, dry_run: bool) -> None:
     is_flag=True,
     help="Disable fsck checks during clone (for repos with malformed objects)",
 )
-def clone(url: str, target: Path, dry_run: bool, no_fsck: bool) -> None:
+@click.option(
+    "--recurse-submodules",
+    is_flag=True,
+    help="Also clone submodules, fetching several in parallel",
+)
+@click.option(
+    "--depth",
+    type=click.IntRange(min=1),
+    help="Make a shallow clone with this many commits of history",
+)
+@click.option(
+    "--filter",
+    "filter_spec",
+    metavar="SPEC",
+    help="Make a partial clone, e.g. 'blob:none' to fetch file contents on demand",
+)
+@click.option(
+    "--no-checkout",
+    is_flag=True,
+    help="Don't check out a working tree after cloning",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=CLONE_JOBS,
+    show_default=True,
+    help="Number of repositories to clone in parallel",
+)
+def clone(
+    urls: tuple[str, ...],
+    target: Path,
+    dry_run: bool,
+    no_fsck: bool,
+    recurse_submodules: bool,
+    depth: int | None,
+    filter_spec: str | None,
+    no_checkout: bool,
+    jobs: int,
+) -> None:
     """
-    Clone a repository and organize it by its origin URL.
+    Clone repositories and organize them by their origin URL.
 
     \b
     Examples:
@@ -182,57 +253,93 @@ def clone(url: str, target: Path, dry_run: bool, no_fsck: bool) -> None:
     \b
       # Clones to ~/projects/github.com/user/repo
       $ reposort clone git@github.com:user/repo.git --target ~/projects
-    """
-    target = target.expanduser().resolve()
 
-    # Parse the URL to determine target path
-    parsed = parse_git_url(url)
-    if not parsed:
-        click.echo(f"Error: Could not parse git URL: {url}", err=True)
-        raise click.Abort()
+    \b
+      # Clones several repositories, four at a time
+      $ reposort clone git@github.com:user/a.git git@github.com:user/b.git --jobs 4
 
-    host, path = parsed
-    target_path = target / host / path
+    \b
+      # Partial clone: history now, file contents on demand
+      $ reposort clone git@github.com:user/repo.git --filter blob:none
+    """
+    target = target.expanduser().resolve()
 
-    # Handle path conflicts
-    final_target = get_unique_target_path(target_path)
+    clones: list[tuple[str, Path]] = []
+    # Targets already handed out, so URLs naming the same repository don't collide
+    claimed: set[Path] = set()
 
-    # Display plan
     click.echo("Clone plan:")
     click.echo("-" * 80)
-    click.echo(f"  URL: {url}")
-    click.echo(f"  Target: {final_target}")
 
-    if final_target != target_path:
-        click.echo(f"  [CONFLICT - target already exists, using {final_target.name}]")
-    click.echo()
+    for url in urls:
+        # Parse the URL to determine target path
+        target_path = get_target_path(target, url)
+        if target_path is None:
+            click.echo(f"Error: Could not parse git URL: {url}", err=True)
+            raise click.Abort()
+
+        # Handle path conflicts
+        final_target, conflict = get_unique_target_path(target_path, claimed)
+        claimed.add(final_target)
+        clones.append((url, final_target))
+
+        # Display plan
+        click.echo(f"  URL: {url}")
+        click.echo(f"  Target: {final_target}")
+
+        if conflict:
+            click.echo(f"  [CONFLICT - target already taken, using {final_target.name}]")
+        click.echo()
 
     # Execute or show dry-run message
     if dry_run:
         click.echo("[DRY RUN] No changes made. Run without --dry-run to execute.")
         return
 
-    # Execute the clone
+    # Execute the clones
     click.echo("Cloning...")
     click.echo("-" * 80)
 
-    try:
-        # Create parent directories
-        final_target.parent.mkdir(parents=True, exist_ok=True)
+    failed = 0
+    results = clone_many(
+        clones,
+        jobs=jobs,
+        no_fsck=no_fsck,
+        recurse_submodules=recurse_submodules,
+        depth=depth,
+        filter_spec=filter_spec,
+        no_checkout=no_checkout,
+    )
+    for url, final_target, error in results:
+        if error is None:
+            click.echo(f"✓ Successfully cloned to {final_target}")
+            continue
+
+        failed += 1
+        if isinstance(error, subprocess.CalledProcessError):
+            click.echo(f"✗ Failed to clone {url}", err=True)
+            if error.stderr:
+                click.echo(f"Git error: {error.stderr.decode('utf-8', 'replace')}", err=True)
+        else:
+            click.echo(f"✗ File system error cloning {url}: {error}", err=True)
+
+    if failed:
+        raise click.Abort()
 
-        # Clone the repository
-        clone_repository(url, final_target, no_fsck=no_fsck)
 
-        click.echo(f"✓ Successfully cloned to {final_target}")
+def _collect(target: Path, *, fast: bool, cached: bool) -> list[RepoInfo]:
+    """Collect repository info for the list and tree views, using the cache if asked."""
+    if not cached:
+        return collect_repo_info(target, fast=fast)
 
-    except subprocess.CalledProcessError as e:
-        click.echo("✗ Failed to clone repository", err=True)
-        if e.stderr:
-            click.echo(f"Git error: {e.stderr}", err=True)
-        raise click.Abort() from e
+    path = cache_file()
+    cache = load_cache(path)
+    repos = collect_repo_info(target, fast=fast, cache=cache)
+    try:
+        save_cache(path, cache)
     except OSError as e:
-        click.echo(f"✗ File system error: {e}", err=True)
-        raise click.Abort() from e
+        click.echo(f"Warning: could not write cache {path}: {e}", err=True)
+    return repos
 
 
 @cli.command("list")
@@ -247,25 +354,42 @@ def clone(url: str, target: Path, dry_run: bool, no_fsck: bool) -> None:
     is_flag=True,
     help="Show only repositories with uncommitted changes",
 )
-def list_repos(target: Path, dirty: bool) -> None:
+@click.option(
+    "--fast",
+    is_flag=True,
+    help="Skip the branch and status checks for a quicker overview",
+)
+@click.option(
+    "--cached",
+    is_flag=True,
+    help="Reuse branch and status from the last --cached run for repositories whose HEAD, "
+    "index and config are unchanged (unstaged edits since then are not noticed)",
+)
+def list_repos(target: Path, dirty: bool, fast: bool, cached: bool) -> None:
     """
     List all repositories in a table view.
 
     Shows host, path, branch, status, and remote URL for each repository.
+    With --fast the branch and status columns are left out.
 
     \b
     Examples:
       $ reposort list
       $ reposort list --dirty
+      $ reposort list --fast
+      $ reposort list --cached
       $ reposort list --target ~/projects
     """
+    if dirty and fast:
+        raise click.UsageError("--dirty needs the status check that --fast skips")
+
     target = target.expanduser().resolve()
 
     if not target.exists():
         click.echo(f"Target directory does not exist: {target}", err=True)
         return
 
-    repos = collect_repo_info(target)
+    repos = _collect(target, fast=fast, cached=cached)
 
     if dirty:
         repos = [r for r in repos if r.dirty]
@@ -278,21 +402,27 @@ def list_repos(target: Path, dirty: bool) -> None:
     # Sort repos by host, then by path
     repos.sort(key=lambda r: (r.host, r.repo_path))
 
-    console = Console()
+    console = make_console()
     title = f"Dirty repositories in {target}" if dirty else f"Repositories in {target}"
     table = Table(title=title)
 
     table.add_column("Host", style="cyan")
     table.add_column("Path", style="green")
-    table.add_column("Branch", style="yellow")
-    table.add_column("Status", style="magenta")
+    if not fast:
+        table.add_column("Branch", style="yellow")
+        table.add_column("Status", style="magenta")
     table.add_column("Remote URL", style="dim")
 
     for repo in repos:
-        status = "[red]dirty[/red]" if repo.dirty else "[green]clean[/green]"
-        branch = repo.branch or "-"
         remote = repo.remote_url or "-"
 
+        if fast:
+            table.add_row(repo.host, repo.repo_path, remote)
+            continue
+
+        status = DIRTY_STATUS if repo.dirty else CLEAN_STATUS
+        branch = repo.branch or "-"
+
         table.add_row(repo.host, repo.repo_path, branch, status, remote)
 
     console.print(table)
@@ -310,7 +440,18 @@ def list_repos(target: Path, dirty: bool) -> None:
     is_flag=True,
     help="Show only repositories with uncommitted changes",
 )
-def tree_repos(target: Path, dirty: bool) -> None:
+@click.option(
+    "--fast",
+    is_flag=True,
+    help="Skip the branch and status checks for a quicker overview",
+)
+@click.option(
+    "--cached",
+    is_flag=True,
+    help="Reuse branch and status from the last --cached run for repositories whose HEAD, "
+    "index and config are unchanged (unstaged edits since then are not noticed)",
+)
+def tree_repos(target: Path, dirty: bool, fast: bool, cached: bool) -> None:
     """
     Display repositories in a tree view organized by host.
 
@@ -318,15 +459,20 @@ def tree_repos(target: Path, dirty: bool) -> None:
     Examples:
       $ reposort tree
       $ reposort tree --dirty
+      $ reposort tree --fast
+      $ reposort tree --cached
       $ reposort tree --target ~/projects
     """
+    if dirty and fast:
+        raise click.UsageError("--dirty needs the status check that --fast skips")
+
     target = target.expanduser().resolve()
 
     if not target.exists():
         click.echo(f"Target directory does not exist: {target}", err=True)
         return
 
-    repos = collect_repo_info(target)
+    repos = _collect(target, fast=fast, cached=cached)
 
     if dirty:
         repos = [r for r in repos if r.dirty]
@@ -340,14 +486,9 @@ def tree_repos(target: Path, dirty: bool) -> None:
     host_tree: dict[str, dict[str, list[RepoInfo]]] = defaultdict(lambda: defaultdict(list))
 
     for repo in repos:
-        parts = repo.repo_path.split("/")
-        if len(parts) >= 2:
-            owner = parts[0]
-            host_tree[repo.host][owner].append(repo)
-        else:
-            host_tree[repo.host][""].append(repo)
+        host_tree[repo.host][repo.owner].append(repo)
 
-    console = Console()
+    console = make_console()
     title = f"[bold]{target}[/bold] [dim](dirty only)[/dim]" if dirty else f"[bold]{target}[/bold]"
     tree = Tree(title)
 
@@ -359,11 +500,13 @@ def tree_repos(target: Path, dirty: bool) -> None:
             owner_branch = host_branch.add(f"[green]{owner}/[/green]") if owner else host_branch
 
             for repo in sorted(owners[owner], key=lambda r: r.repo_path):
-                parts = repo.repo_path.split("/")
-                repo_name = parts[-1] if len(parts) > 1 else repo.repo_path
+                if fast:
+                    owner_branch.add(repo.name)
+                    continue
+
                 branch = repo.branch or "?"
-                status = "[red]dirty[/red]" if repo.dirty else "[green]clean[/green]"
-                owner_branch.add(f"{repo_name} ([yellow]{branch}[/yellow], {status})")
+                status = DIRTY_STATUS if repo.dirty else CLEAN_STATUS
+                owner_branch.add(f"{repo.name} ([yellow]{branch}[/yellow], {status})")
 
     console.print(tree)
 
@@ -1,28 +1,158 @@
 """Core functionality for organising git repositories."""
 
+import errno
+import os
+import queue
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any
+from urllib.parse import unquote
+
+# Body of a [remote "origin"] section in a git config file, up to the next section.
+# Section names are case-insensitive, subsection names are not
+_ORIGIN_SECTION_RE = re.compile(
+    rb'^[ \t]*\[(?i:remote)[ \t]+"origin"\][ \t]*\r?$((?:\n(?![ \t]*\[).*)*)', re.MULTILINE
+)
+# A url = ... entry within a section (keys are case-insensitive)
+_URL_ENTRY_RE = re.compile(rb"^[ \t]*url[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE | re.IGNORECASE)
+# Quotes, escapes and comments, which only git itself should interpret
+_VALUE_SYNTAX_RE = re.compile(rb'["\\;#]')
+# [include] or [includeIf "..."] sections pull in other files
+_INCLUDE_RE = re.compile(rb"^[ \t]*\[include", re.MULTILINE | re.IGNORECASE)
+
+# Environment for read-only git queries. LC_ALL=C skips locale setup and message
+# translation; everything else is inherited, since git needs platform variables
+# (USERPROFILE, SYSTEMROOT) and GIT_CONFIG_* to find the user's configuration
+_GIT_ENV = os.environ | {"LC_ALL": "C"}
+
+# Number of repositories whose origin URLs are resolved per batch
+ORIGIN_BATCH_SIZE = 32
+
+# Default number of repositories cloned at once by clone_many
+CLONE_JOBS = 8
+
+# Number of submodules fetched at once when cloning recursively
+SUBMODULE_JOBS = 8
+
+
+def _default_workers() -> int:
+    """Worker count for thread pools driving I/O-bound git subprocesses."""
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _git_dir(repo_path: Path) -> Path:
+    """
+    Get the git directory of a repository.
+    Follows the 'gitdir:' pointer used by linked worktrees and submodules.
+    """
+    dot_git = repo_path / ".git"
+    try:
+        pointer = dot_git.read_bytes().decode("utf-8", "replace")
+    except OSError:
+        # Usually a plain .git directory
+        return dot_git
+    return repo_path / pointer.strip().removeprefix("gitdir:").strip()
+
+
+def _common_dir(git_dir: Path) -> Path:
+    """Get the directory holding state shared between worktrees, such as config."""
+    try:
+        common = (git_dir / "commondir").read_bytes().decode("utf-8", "replace").strip()
+    except OSError:
+        return git_dir
+    return git_dir / common
+
+
+def _read_origin_from_config(repo_path: Path) -> str:
+    """
+    Read the origin URL straight from the repository's config file.
+
+    The file is scanned as bytes and only the URL itself is decoded.
+
+    Raises:
+        LookupError: If no origin URL is found in a layout this reader knows, the
+            config includes other files, which may define origin, or the URL is
+            quoted, escaped or followed by a comment
+        OSError: If the config file cannot be read
+    """
+    config = (_common_dir(_git_dir(repo_path)) / "config").read_bytes()
+
+    # As with git config --get, the last value wins
+    urls = [
+        url
+        for section in _ORIGIN_SECTION_RE.finditer(config)
+        for url in _URL_ENTRY_RE.findall(section.group(1))
+    ]
+    if not urls:
+        raise LookupError("no origin url found")
+    if _INCLUDE_RE.search(config):
+        raise LookupError("config includes other files")
+    if _VALUE_SYNTAX_RE.search(urls[-1]):
+        raise LookupError("origin url needs unquoting")
+    return urls[-1].decode("utf-8", "replace")
 
 
 def get_git_origin_url(repo_path: Path) -> str | None:
-    """Get the origin URL of a git repository."""
+    """
+    Get the origin URL of a git repository.
+
+    The URL is read from the config file directly, which avoids spawning git;
+    git itself is only asked when the simple reader finds no plain origin URL,
+    or the config cannot be read or includes other files.
+    """
+    try:
+        return _read_origin_from_config(repo_path)
+    except (LookupError, OSError):
+        pass
+
     try:
         result = subprocess.run(
-            ["git", "-C", str(repo_path), "config", "--get", "remote.origin.url"],
+            ["git", "-C", os.fspath(repo_path), "config", "--get", "remote.origin.url"],
+            env=_GIT_ENV,
             capture_output=True,
-            text=True,
             check=True,
         )
-        return result.stdout.strip()
+        return result.stdout.decode("utf-8", "replace").strip()
     except subprocess.CalledProcessError:
         return None
 
 
+def get_all_origin_urls(repos: Iterable[Path]) -> Iterator[tuple[Path, str | None]]:
+    """
+    Get the origin URL of each repository, resolving them concurrently.
+
+    Repositories are consumed in batches, so results for the first ones are
+    yielded while later ones are still being discovered.
+
+    Yields:
+        (repo, origin_url) pairs in input order
+    """
+    iterator = iter(repos)
+    with ThreadPoolExecutor(max_workers=_default_workers()) as pool:
+        while batch := list(islice(iterator, ORIGIN_BATCH_SIZE)):
+            yield from zip(batch, pool.map(get_git_origin_url, batch), strict=True)
+
+
 def clone_repository(
-    url: str, target_path: Path, *, no_fsck: bool = False
+    url: str,
+    target_path: Path,
+    *,
+    no_fsck: bool = False,
+    recurse_submodules: bool = False,
+    depth: int | None = None,
+    filter_spec: str | None = None,
+    no_checkout: bool = False,
+    quiet: bool = True,
 ) -> subprocess.CompletedProcess:
     """
     Clone a git repository to the specified path.
@@ -32,6 +162,15 @@ def clone_repository(
         target_path: Destination path for the cloned repository
         no_fsck: If True, disable fsck checks during clone (useful for repos with
             malformed objects like invalid submodule URLs)
+        recurse_submodules: If True, also clone submodules, SUBMODULE_JOBS at a time
+        depth: If set, make a shallow clone with this many commits of history
+        filter_spec: If set, make a partial clone with this object filter. reposort
+            only needs the origin URL to place a repository, so "blob:none" is
+            safe and fetches file contents on demand.
+        no_checkout: If True, don't check out a working tree after cloning
+        quiet: If True, suppress git's progress output and capture only stderr,
+            as undecoded bytes, for error reporting. If False, git writes
+            straight to the terminal.
 
     Returns:
         subprocess.CompletedProcess with result of git clone
@@ -42,110 +181,410 @@ def clone_repository(
     cmd = ["git"]
     if no_fsck:
         cmd.extend(["-c", "transfer.fsckObjects=false"])
-    cmd.extend(["clone", url, str(target_path)])
+    cmd.append("clone")
+    if quiet:
+        cmd.append("--quiet")
+    if recurse_submodules:
+        cmd.extend(["--recurse-submodules", f"--jobs={SUBMODULE_JOBS}"])
+    if depth is not None:
+        cmd.extend(["--depth", str(depth)])
+    if filter_spec:
+        cmd.extend(["--filter", filter_spec])
+    if no_checkout:
+        cmd.append("--no-checkout")
+    cmd.extend([url, os.fspath(target_path)])
+
+    if not quiet:
+        return subprocess.run(cmd, check=True)
 
     return subprocess.run(
         cmd,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         check=True,
     )
 
 
+def clone_many(
+    clones: Iterable[tuple[str, Path]], *, jobs: int = CLONE_JOBS, **options: Any
+) -> Iterator[tuple[str, Path, Exception | None]]:
+    """
+    Clone several repositories concurrently.
+
+    Parent directories are created as needed. A failed clone is reported in the
+    results rather than raised, so it doesn't stop the rest of the batch.
+
+    Args:
+        clones: (url, target_path) pairs to clone
+        jobs: Number of clones to run at once
+        **options: Keyword arguments passed through to clone_repository
+
+    Yields:
+        (url, target_path, error) as each clone finishes; error is None on
+        success, otherwise the subprocess.CalledProcessError or OSError raised
+    """
+
+    def run(url: str, target_path: Path) -> None:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        clone_repository(url, target_path, **options)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(run, url, target_path): (url, target_path) for url, target_path in clones
+        }
+        for future in as_completed(futures):
+            url, target_path = futures[future]
+            try:
+                future.result()
+            except (subprocess.CalledProcessError, OSError) as e:
+                yield url, target_path, e
+            else:
+                yield url, target_path, None
+
+
+def move_repository(source: Path, target: Path) -> None:
+    """
+    Move a repository directory to target.
+
+    On the same filesystem this is a single rename. Across filesystems the tree
+    is copied, sharing data blocks via reflinks where the filesystem supports
+    it, and the source is removed once the copy succeeds.
+
+    Raises:
+        FileExistsError: If target already exists
+        OSError: If the rename, copy or removal fails
+    """
+    if os.path.lexists(target):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), os.fspath(target))
+    try:
+        os.rename(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_tree(source, target)
+        shutil.rmtree(source)
+
+
+def _copy_tree(source: Path, target: Path) -> None:
+    """Copy a directory tree, cloning file data instead of copying where possible."""
+    # Copy into a staging directory of our own next to target and rename it into
+    # place at the end, so a failed copy is only ever cleaned up from there
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+    copy = staging / target.name
+    try:
+        if not _copy_tree_reflink(source, copy):
+            shutil.copytree(source, copy, symlinks=True)
+        if os.path.lexists(target):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), os.fspath(target))
+        os.rename(copy, target)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _copy_tree_reflink(source: Path, target: Path) -> bool:
+    """
+    Copy a directory tree with cp --reflink=auto.
+
+    Returns False, without copying, where cp does not support --reflink.
+
+    Raises:
+        OSError: If cp fails for any other reason
+    """
+    if sys.platform != "linux":
+        return False
+    # A single cp for the whole tree; --reflink=auto clones extents on btrfs/xfs
+    # (e.g. between btrfs subvolumes) and copies otherwise
+    result = subprocess.run(
+        ["cp", "-a", "--reflink=auto", os.fspath(source), os.fspath(target)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode == 0:
+        return True
+    message = result.stderr.decode("utf-8", "replace").strip()
+    # cp without --reflink support (e.g. busybox) rejects the option up front
+    if "reflink" in message:
+        return False
+    raise OSError(message or f"cp exited with status {result.returncode}")
+
+
+def _normalize_path(path: str) -> str:
+    """Collapse runs of slashes in a repository path."""
+    if "//" in path:
+        path = "/".join(part for part in path.split("/") if part)
+    return path
+
+
+def _parse_ssh_scheme(rest: str) -> tuple[str, str] | None:
+    """Parse the part of an ssh://[user@]host[:port]/path URL after the scheme."""
+    # Remove user@ if present
+    if "@" in rest:
+        rest = rest.split("@", 1)[1]
+    # Split host:port from path
+    if "/" not in rest:
+        return None
+    host_part, path = rest.split("/", 1)
+    # Remove port if present
+    host = host_part.split(":")[0]
+    # Remove .git extension and trailing slashes
+    path = path.removesuffix(".git").rstrip("/")
+    return (host.lower(), _normalize_path(unquote(path)))
+
+
+def _parse_http(rest: str) -> tuple[str, str]:
+    """Parse the part of an http(s)://[user@]host[:port]/path URL after the scheme."""
+    # Drop any fragment and query, as urlparse did
+    rest = rest.partition("#")[0].partition("?")[0]
+    authority, _, path = rest.partition("/")
+    # Strip username from URLs like https://user@host/path, then the port
+    host = authority.rpartition("@")[2]
+    # IPv6 literals are bracketed: https://[::1]:8080/path
+    host = host[1:].partition("]")[0] if host[:1] == "[" else host.partition(":")[0]
+    # Hostnames are case-insensitive; keep them lowercase as urlparse did
+    host = host.lower() or authority
+    # Remove leading slashes, .git extension and trailing slashes
+    path = path.lstrip("/").removesuffix(".git").rstrip("/")
+    return (host, _normalize_path(unquote(path)))
+
+
+# URL schemes with a dedicated parser; anything else is tried as scp-style
+# shorthand
+_HANDLERS = {"ssh": _parse_ssh_scheme, "http": _parse_http, "https": _parse_http}
+
+
+@lru_cache(maxsize=4096)
 def parse_git_url(url: str) -> tuple[str, str] | None:
     """
     Parse a git URL and extract host and path.
     Handles SSH, HTTPS, and ssh:// URL formats.
     Returns (host, repo_path) or None if parsing fails.
+
+    The result is normalized: the host is lowercased, duplicate slashes in the
+    path are collapsed and percent-escapes in URL-style remotes are decoded, so
+    equal remotes map to equal tuples and can be used as dict keys directly.
     """
     if not url:
         return None
 
-    # ssh:// format: ssh://git@host:port/path/to/repo.git
-    # Check this FIRST before other patterns
-    if url.startswith("ssh://"):
-        # Remove ssh:// prefix
-        url_without_prefix = url[6:]
-        # Remove user@ if present
-        if "@" in url_without_prefix:
-            url_without_prefix = url_without_prefix.split("@", 1)[1]
-        # Split host:port from path
-        if "/" in url_without_prefix:
-            host_part, path = url_without_prefix.split("/", 1)
-            # Remove port if present
-            host = host_part.split(":")[0]
-            # Remove .git extension
-            if path.endswith(".git"):
-                path = path[:-4]
-            path = path.rstrip("/")
-            return (host, path)
-
-    # HTTPS/HTTP format: https://github.com/user/repo.git
-    # Also handles URLs with embedded usernames like https://user@host/path
-    if url.startswith("http://") or url.startswith("https://"):
-        parsed = urlparse(url)
-        # Use hostname to strip username from URLs like https://user@host/path
-        host = parsed.hostname or parsed.netloc
-        path = parsed.path.lstrip("/")
-        # Remove .git extension
-        if path.endswith(".git"):
-            path = path[:-4]
-        path = path.rstrip("/")
-        return (host, path)
+    # ssh://, http:// and https:// URLs: one lookup on the scheme picks the parser
+    scheme, sep, rest = url.partition("://")
+    handler = _HANDLERS.get(scheme) if sep else None
+    if handler is not None and (parsed := handler(rest)) is not None:
+        return parsed
 
     # SSH format: git@github.com:user/repo.git or github.com:user/repo.git
-    ssh_pattern = r"^(?:[\w\-]+@)?([^:]+):(.+?)(?:\.git)?$"
-    ssh_match = re.match(ssh_pattern, url)
-    if ssh_match:
-        host = ssh_match.group(1)
-        path = ssh_match.group(2)
-        # Strip leading slashes to handle malformed URLs like git@host:/path
-        path = path.lstrip("/")
-        # Remove trailing slashes
-        path = path.rstrip("/")
-        return (host, path)
-    return None
+    host, sep, path = url.partition(":")
+    if not sep or not host or not path:
+        return None
+    # Drop a user@ prefix made of word characters and dashes
+    user, at, bare_host = host.partition("@")
+    if at and bare_host and user.replace("-", "_").replace("_", "a").isalnum():
+        host = bare_host
+    # Remove .git extension, unless that is all there is
+    if len(path) > 4:
+        path = path.removesuffix(".git")
+    # Strip leading slashes to handle malformed URLs like git@host:/path,
+    # and trailing slashes
+    path = path.strip("/")
+    return (host.lower(), _normalize_path(path))
+
+
+@lru_cache(maxsize=4096)
+def get_target_path(target_base: Path, url: str) -> Path | None:
+    """
+    Get the organised location target_base/host/path for a git URL.
+    Returns None if the URL cannot be parsed.
+    """
+    parsed = parse_git_url(url)
+    if not parsed:
+        return None
+
+    host, path = parsed
+    return target_base / host / path
+
+
+WALK_WORKERS = 8
+
+# Directories that never hold repositories worth organising
+SKIP_DIRS = frozenset({"node_modules", ".venv"})
+
+
+def find_git_repos(
+    base_path: Path, *, workers: int = WALK_WORKERS, skip_dirs: Collection[str] = SKIP_DIRS
+) -> list[Path]:
+    """Find all git repositories recursively in the given path.
+
+    Waits for the whole walk; use iter_git_repos to start on results early.
+    """
+    return list(iter_git_repos(base_path, workers=workers, skip_dirs=skip_dirs))
+
+
+def iter_git_repos(
+    base_path: Path, *, workers: int = WALK_WORKERS, skip_dirs: Collection[str] = SKIP_DIRS
+) -> Iterator[Path]:
+    """Yield git repositories under the given path while the walk is running.
+
+    Directories are scanned with os.scandir by a pool of threads pulling from a
+    shared queue, so metadata latency on large or cold trees overlaps. Entry
+    types come from the cached d_type. The walk does not descend into a
+    repository once found, so nested repositories and submodules are not
+    reported, and directories named in skip_dirs are pruned. Linked worktrees
+    and standalone submodule checkouts, whose .git is a gitdir pointer file,
+    are reported too. Repositories are yielded as soon as they are found.
+    """
+    for repo, _parts in _walk_git_repos(base_path, workers=workers, skip_dirs=skip_dirs):
+        yield repo
 
 
-def find_git_repos(base_path: Path) -> list[Path]:
-    """Find all git repositories recursively in the given path."""
-    repos = []
+def _is_gitdir_file(path: str) -> bool:
+    """Check whether a .git file is a gitdir pointer, as in worktrees and submodules."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(256).startswith(b"gitdir:")
+    except OSError:
+        return False
 
-    # Recursively find all .git directories
-    for git_dir in base_path.rglob(".git"):
-        if git_dir.is_dir():
-            # The parent of .git is the repository root
-            repo_path = git_dir.parent
-            repos.append(repo_path)
 
-    return repos
+def _is_repo_marker(entry: os.DirEntry[str]) -> bool:
+    """Check whether a .git entry makes its parent directory a repository."""
+    if entry.is_dir(follow_symlinks=False):
+        return True
+    if entry.is_file(follow_symlinks=False):
+        return _is_gitdir_file(entry.path)
+    # A .git symlink to a git directory, which rglob found too; only .git
+    # entries pay for this stat
+    return entry.is_symlink() and os.path.isdir(entry.path)
 
 
-def get_unique_target_path(base_target: Path) -> Path:
+def _walk_git_repos(
+    base_path: Path, *, workers: int = WALK_WORKERS, skip_dirs: Collection[str] = SKIP_DIRS
+) -> Iterator[tuple[Path, tuple[str, ...]]]:
+    """Yield (repo, parts) for each repository, parts being its path relative to base_path."""
+    found: queue.Queue[tuple[Path, tuple[str, ...]] | None] = queue.Queue()
+    pending: queue.Queue[tuple[str, tuple[str, ...]] | None] = queue.Queue()
+
+    seen: set[tuple[int, int]] = set()
+    seen_lock = threading.Lock()
+
+    def scan(current: str, parts: tuple[str, ...]) -> None:
+        try:
+            st = os.lstat(current)
+        except OSError:
+            return
+
+        # Symlinks are never followed, but bind mounts can still expose the same
+        # directory twice or form a loop
+        with seen_lock:
+            if (st.st_dev, st.st_ino) in seen:
+                return
+            seen.add((st.st_dev, st.st_ino))
+
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            return
+
+        subdirs = []
+        # Reading entries can fail part way (EIO, ESTALE on NFS); skip the
+        # directory then, as rglob does
+        try:
+            with entries:
+                for entry in entries:
+                    if entry.name == ".git":
+                        if _is_repo_marker(entry):
+                            # The parent of .git is the repository root; skip its
+                            # working tree
+                            found.put((Path(current), parts))
+                            return
+                    elif entry.name not in skip_dirs and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry)
+        except OSError:
+            return
+
+        for entry in subdirs:
+            pending.put((entry.path, (*parts, entry.name)))
+
+    def work() -> None:
+        while (item := pending.get()) is not None:
+            # A worker must survive any error, or directories still queued are
+            # never taken off and pending.join() waits forever
+            try:
+                scan(*item)
+            except Exception:
+                pass
+            finally:
+                pending.task_done()
+
+    def finish() -> None:
+        pending.join()
+        for _ in range(workers):
+            pending.put(None)
+        found.put(None)
+
+    pending.put((os.fspath(base_path), ()))
+    for _ in range(workers):
+        threading.Thread(target=work, daemon=True).start()
+    threading.Thread(target=finish, daemon=True).start()
+
+    while (result := found.get()) is not None:
+        yield result
+
+
+def get_unique_target_path(base_target: Path, claimed: Collection[Path] = ()) -> tuple[Path, bool]:
     """
     Get a unique target path by appending -copy1, -copy2, etc. if needed.
+
+    The suffix is one past the highest existing copy, found with a single scan
+    of the parent directory rather than a stat per candidate. Paths in claimed,
+    such as targets already planned for other repositories, count as taken too.
+
+    Returns (path, conflict) where conflict is True if base_target was taken.
     """
-    if not base_target.exists():
-        return base_target
+    if base_target not in claimed and not os.path.lexists(base_target):
+        return base_target, False
+
+    names = [path.name for path in claimed if path.parent == base_target.parent]
+    try:
+        with os.scandir(base_target.parent) as entries:
+            names.extend(entry.name for entry in entries)
+    except FileNotFoundError:
+        pass
+
+    prefix = f"{base_target.name}-copy"
+    highest = 0
+    for name in names:
+        if name.startswith(prefix):
+            counter = name[len(prefix) :]
+            if counter.isdecimal():
+                highest = max(highest, int(counter))
 
-    counter = 1
-    while True:
-        new_target = Path(f"{base_target}-copy{counter}")
-        if not new_target.exists():
-            return new_target
-        counter += 1
+    return base_target.parent / f"{prefix}{highest + 1}", True
 
 
 def get_repo_branch(repo_path: Path) -> str | None:
-    """Get the current branch name of a git repository."""
+    """
+    Get the current branch name of a git repository.
+
+    The branch is read from HEAD directly; git is only asked when HEAD is
+    detached, cannot be read or is the stub left by the reftable backend.
+    """
+    try:
+        head = (_git_dir(repo_path) / "HEAD").read_bytes().decode("utf-8", "replace").strip()
+    except OSError:
+        head = ""
+    # Repositories using extensions.refStorage = reftable keep the real HEAD in
+    # the reftable and point HEAD at ".invalid", which is never a valid branch
+    if head.startswith("ref: refs/heads/") and head != "ref: refs/heads/.invalid":
+        return head.removeprefix("ref: refs/heads/")
+
     try:
         result = subprocess.run(
-            ["git", "-C", str(repo_path), "rev-parse", "--abbrev-ref", "HEAD"],
+            ["git", "-C", os.fspath(repo_path), "rev-parse", "--abbrev-ref", "HEAD"],
+            env=_GIT_ENV,
             capture_output=True,
-            text=True,
             check=True,
         )
-        return result.stdout.strip()
+        return result.stdout.decode("utf-8", "replace").strip()
     except subprocess.CalledProcessError:
         return None
 
@@ -157,9 +596,9 @@ def is_dirty(repo_path: Path) -> bool:
     """
     try:
         result = subprocess.run(
-            ["git", "-C", str(repo_path), "status", "--porcelain"],
+            ["git", "-C", os.fspath(repo_path), "status", "--porcelain"],
+            env=_GIT_ENV,
             capture_output=True,
-            text=True,
             check=True,
         )
         return bool(result.stdout.strip())
@@ -167,6 +606,32 @@ def is_dirty(repo_path: Path) -> bool:
         return False
 
 
+def get_repo_quickinfo(repo_path: Path) -> tuple[str | None, str | None, bool]:
+    """Get origin URL, branch and dirty state with as few git calls as possible.
+
+    The branch and origin URL are read straight from HEAD and the config file;
+    only the dirty check needs a git subprocess in the common case.
+
+    Returns:
+        Tuple of (remote_url, branch, dirty)
+    """
+    # Start git status first so it runs while HEAD and config are read, along
+    # with any git fallbacks those need
+    status = subprocess.Popen(
+        ["git", "-C", os.fspath(repo_path), "status", "--porcelain"],
+        env=_GIT_ENV,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    remote_url = get_git_origin_url(repo_path)
+    branch = get_repo_branch(repo_path)
+
+    output, _ = status.communicate()
+    dirty = status.returncode == 0 and bool(output.strip())
+
+    return remote_url, branch, dirty
+
+
 @dataclass
 class RepoInfo:
     """Information about a git repository."""
@@ -174,51 +639,103 @@ class RepoInfo:
     path: Path
     host: str
     repo_path: str
+    owner: str  # first component of repo_path, "" if it has only one
+    name: str  # last component of repo_path
     branch: str | None
     dirty: bool
     remote_url: str | None
 
 
-def collect_repo_info(base_path: Path) -> list[RepoInfo]:
+def _status_stamp(repo_path: Path) -> list[int | None]:
+    """Get the modification times of HEAD, index and config, None where missing."""
+    git_dir = _git_dir(repo_path)
+    stamp: list[int | None] = []
+    for path in (git_dir / "HEAD", git_dir / "index", _common_dir(git_dir) / "config"):
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+
+def _collect_one(
+    found: tuple[Path, tuple[str, ...]], fast: bool, cache: dict[str, Any] | None
+) -> RepoInfo:
+    """Gather the RepoInfo for a repository, given its path parts below the scan root."""
+    repo, parts = found
+    if fast:
+        remote_url, branch, dirty = get_git_origin_url(repo), None, False
+    elif cache is None:
+        remote_url, branch, dirty = get_repo_quickinfo(repo)
+    else:
+        key = os.fspath(repo)
+        # Stamp before querying so changes made meanwhile invalidate the entry
+        stamp = _status_stamp(repo)
+        entry = cache.get(key)
+        if isinstance(entry, dict) and entry.get("stamp") == stamp:
+            remote_url, branch, dirty = entry["remote_url"], entry["branch"], entry["dirty"]
+        else:
+            remote_url, branch, dirty = get_repo_quickinfo(repo)
+            cache[key] = {
+                "stamp": stamp,
+                "remote_url": remote_url,
+                "branch": branch,
+                "dirty": dirty,
+            }
+
+    # Extract host and path from directory structure
+    if len(parts) >= 2:
+        host = parts[0]
+        repo_path_str = "/".join(parts[1:])
+        owner = parts[1] if len(parts) >= 3 else ""
+        name = parts[-1]
+    else:
+        host = "unknown"
+        repo_path_str = parts[0] if parts else "."
+        owner, name = "", repo_path_str
+
+    return RepoInfo(
+        path=repo,
+        host=host,
+        repo_path=repo_path_str,
+        owner=owner,
+        name=name,
+        branch=branch,
+        dirty=dirty,
+        remote_url=remote_url,
+    )
+
+
+def collect_repo_info(
+    base_path: Path, *, fast: bool = False, cache: dict[str, Any] | None = None
+) -> list[RepoInfo]:
     """Scan a directory and collect information about all git repositories.
 
+    Repositories are inspected concurrently; the work is dominated by waiting
+    on git subprocesses, so threads overlap nicely.
+
     Args:
         base_path: The base directory to scan (e.g., ~/code)
+        fast: If True, skip the branch and dirty checks; branch is None and
+            dirty is False for every repository
+        cache: Entries from a previous scan, keyed by repository path. Entries
+            whose HEAD, index and config are unchanged are reused instead of
+            querying git; the rest are refreshed in place, and entries for
+            repositories below base_path that no longer exist are dropped.
+            Unstaged edits don't touch those files, so a reused dirty state
+            can be stale.
 
     Returns:
         List of RepoInfo objects for each repository found
     """
-    repos = find_git_repos(base_path)
-    repo_infos: list[RepoInfo] = []
-
-    for repo in repos:
-        remote_url = get_git_origin_url(repo)
-        branch = get_repo_branch(repo)
-        dirty = is_dirty(repo)
-
-        # Try to extract host and path from directory structure
-        try:
-            rel_path = repo.relative_to(base_path)
-            parts = rel_path.parts
-            if len(parts) >= 2:
-                host = parts[0]
-                repo_path_str = "/".join(parts[1:])
-            else:
-                host = "unknown"
-                repo_path_str = str(rel_path)
-        except ValueError:
-            host = "unknown"
-            repo_path_str = repo.name
-
-        repo_infos.append(
-            RepoInfo(
-                path=repo,
-                host=host,
-                repo_path=repo_path_str,
-                branch=branch,
-                dirty=dirty,
-                remote_url=remote_url,
-            )
-        )
+    collect = partial(_collect_one, fast=fast, cache=cache)
+    with ThreadPoolExecutor(max_workers=_default_workers()) as pool:
+        repo_infos = list(pool.map(collect, _walk_git_repos(base_path)))
+
+    if cache is not None and not fast:
+        seen = {os.fspath(info.path) for info in repo_infos}
+        prefix = os.path.join(base_path, "")
+        for key in [k for k in cache if k.startswith(prefix) and k not in seen]:
+            del cache[key]
 
     return repo_infos